@@ -0,0 +1,20 @@
+(() => {
+    const select = document.getElementById('version-select');
+    const panels = Array.from(document.querySelectorAll('.version-panel'));
+    if (!select || panels.length === 0) return;
+    const params = new URLSearchParams(window.location.search);
+    const requestedVersion = params.get('version');
+    if (requestedVersion) {
+        const option = Array.from(select.options).find(opt => opt.value === requestedVersion);
+        if (option) {
+            select.value = requestedVersion;
+        }
+    }
+    function show(version) {
+        panels.forEach(panel => {
+            panel.classList.toggle('active', panel.dataset.version === version);
+        });
+    }
+    select.addEventListener('change', () => show(select.value));
+    show(select.value);
+})();
@@ -389,6 +389,10 @@ tr:last-child td {
     vertical-align: top;
 }
 
+[data-filter-item].hidden {
+    display: none;
+}
+
 .record-cell a {
     font-weight: 600;
     font-size: 0.9rem;
@@ -728,6 +732,11 @@ body:has(.stories-layout) {
     letter-spacing: 0.02em;
 }
 
+.epic-stories-show-more {
+    align-self: flex-start;
+    margin-top: 0.5rem;
+}
+
 .epic-drawer-backdrop {
     display: none;
 }
@@ -1402,6 +1411,543 @@ VERSION_CHECK_JS = """
     </script>
 """
 
+# Version selector for epic and story detail pages (served as docs/assets/version-select.js)
+VERSION_SELECT_JS = """(() => {
+    const select = document.getElementById('version-select');
+    const panels = Array.from(document.querySelectorAll('.version-panel'));
+    if (!select || panels.length === 0) return;
+    const params = new URLSearchParams(window.location.search);
+    const requestedVersion = params.get('version');
+    if (requestedVersion) {
+        const option = Array.from(select.options).find(opt => opt.value === requestedVersion);
+        if (option) {
+            select.value = requestedVersion;
+        }
+    }
+    function show(version) {
+        panels.forEach(panel => {
+            panel.classList.toggle('active', panel.dataset.version === version);
+        });
+    }
+    select.addEventListener('change', () => show(select.value));
+    show(select.value);
+})();
+"""
+
+# Search/status filtering for index tables
+INDEX_FILTER_JS = """
+<script>
+(() => {
+    const searchInput = document.getElementById('search-input');
+    const statusFilter = document.getElementById('status-filter');
+    const items = Array.from(document.querySelectorAll('[data-filter-item]'));
+    const countEl = document.getElementById('results-count');
+    if (!searchInput || !statusFilter || !countEl) return;
+
+    // Lowercased filter fields, read from the data attributes once
+    const itemIndex = items.map((item) => ({
+        el: item,
+        text: (item.dataset.searchText || '').toLowerCase(),
+        status: (item.dataset.status || '').toLowerCase(),
+    }));
+
+    // All row class changes for one filter pass land in a single frame
+    let filterFrame = 0;
+
+    function applyFilters() {
+        cancelAnimationFrame(filterFrame);
+        filterFrame = requestAnimationFrame(() => {
+            const term = searchInput.value.trim().toLowerCase();
+            const status = statusFilter.value.toLowerCase();
+            let visible = 0;
+            itemIndex.forEach((entry) => {
+                const matchesTerm = !term || entry.text.includes(term);
+                const matchesStatus = status === 'all' || entry.status === status;
+                const show = matchesTerm && matchesStatus;
+                entry.el.classList.toggle('hidden', !show);
+                if (show) visible += 1;
+            });
+            countEl.textContent = `${visible} of ${items.length} shown`;
+        });
+    }
+
+    function debounce(fn, ms) {
+        let timer;
+        return (...args) => {
+            clearTimeout(timer);
+            timer = setTimeout(() => fn(...args), ms);
+        };
+    }
+
+    // Typing re-filters after a short pause; dropdown changes apply immediately
+    searchInput.addEventListener('input', debounce(applyFilters, 100));
+    statusFilter.addEventListener('change', applyFilters);
+    applyFilters();
+})();
+</script>
+"""
+
+# Stories index: epic filter, epic drawer and filtering
+STORIES_INDEX_JS = """
+<script>
+(() => {
+    const searchInput = document.getElementById('search-input');
+    const statusFilter = document.getElementById('status-filter');
+    const epicDropdown = document.getElementById('epic-filter-dropdown');
+    const epicTrigger = document.getElementById('epic-filter-trigger');
+    const epicMenu = document.getElementById('epic-filter-menu');
+    const epicSearch = document.getElementById('epic-filter-search');
+    const epicList = document.getElementById('epic-filter-list');
+    const items = Array.from(document.querySelectorAll('[data-filter-item]'));
+    const countEl = document.getElementById('results-count');
+    const storiesLayout = document.getElementById('stories-layout');
+    const epicDrawer = document.getElementById('epic-drawer');
+    const epicDrawerClose = document.getElementById('epic-drawer-close');
+    const epicDrawerBackdrop = document.getElementById('epic-drawer-backdrop');
+    const epicDrawerTitle = document.getElementById('epic-drawer-title');
+    const epicDrawerMeta = document.getElementById('epic-drawer-meta');
+    const epicDrawerBody = document.getElementById('epic-drawer-body');
+    const resizeHandle = document.getElementById('epic-drawer-resize-handle');
+
+    if (!searchInput || !statusFilter || !countEl) return;
+
+    // Get selected epics from checkboxes
+    function getSelectedEpics() {
+        if (!epicList) return [];
+        return Array.from(epicList.querySelectorAll('input[type="checkbox"]:checked')).map(input => input.value);
+    }
+
+    // Update trigger text
+    function updateEpicTrigger() {
+        if (!epicTrigger) return;
+        const selected = getSelectedEpics();
+        if (selected.length === 0) {
+            epicTrigger.textContent = 'All epics';
+        } else if (selected.length === 1) {
+            epicTrigger.textContent = selected[0];
+        } else {
+            epicTrigger.textContent = `${selected.length} epics selected`;
+        }
+    }
+
+    // Filter epic list items
+    function filterEpicList(term) {
+        if (!epicList) return;
+        const normalized = (term || '').toLowerCase();
+        Array.from(epicList.querySelectorAll('label')).forEach(item => {
+            const text = item.textContent.toLowerCase();
+            item.style.display = !normalized || text.includes(normalized) ? '' : 'none';
+        });
+    }
+
+    // Lowercased filter fields, read from the data attributes once
+    const itemIndex = items.map((item) => ({
+        el: item,
+        text: (item.dataset.searchText || '').toLowerCase(),
+        status: (item.dataset.status || '').toLowerCase(),
+        epic: item.dataset.epic || '',
+    }));
+
+    // All row class changes for one filter pass land in a single frame
+    let filterFrame = 0;
+
+    function applyFilters() {
+        cancelAnimationFrame(filterFrame);
+        filterFrame = requestAnimationFrame(() => {
+            const term = searchInput.value.trim().toLowerCase();
+            const status = statusFilter.value.toLowerCase();
+            const selectedEpics = new Set(getSelectedEpics());
+            const filterByEpic = selectedEpics.size > 0;
+
+            let visible = 0;
+            itemIndex.forEach((entry) => {
+                const matchesTerm = !term || entry.text.includes(term);
+                const matchesStatus = status === 'all' || entry.status === status;
+                const matchesEpic = !filterByEpic || selectedEpics.has(entry.epic);
+
+                const show = matchesTerm && matchesStatus && matchesEpic;
+                entry.el.classList.toggle('hidden', !show);
+                if (show) visible += 1;
+            });
+            countEl.textContent = `${visible} of ${items.length} shown`;
+            updateEpicTrigger();
+        });
+    }
+
+    // Epic dropdown toggle
+    if (epicTrigger && epicDropdown) {
+        epicTrigger.addEventListener('click', () => {
+            const isOpen = epicDropdown.classList.contains('open');
+            if (isOpen) {
+                epicDropdown.classList.remove('open');
+                epicTrigger.setAttribute('aria-expanded', 'false');
+            } else {
+                epicDropdown.classList.add('open');
+                epicTrigger.setAttribute('aria-expanded', 'true');
+                if (epicSearch) epicSearch.focus();
+            }
+        });
+
+        // Close on outside click
+        document.addEventListener('click', (event) => {
+            if (!epicDropdown.contains(event.target)) {
+                epicDropdown.classList.remove('open');
+                epicTrigger.setAttribute('aria-expanded', 'false');
+            }
+        });
+
+        // Close on Escape
+        document.addEventListener('keydown', (event) => {
+            if (event.key === 'Escape' && epicDropdown.classList.contains('open')) {
+                epicDropdown.classList.remove('open');
+                epicTrigger.setAttribute('aria-expanded', 'false');
+            }
+        });
+    }
+
+    // Epic filter search
+    if (epicSearch) {
+        epicSearch.addEventListener('input', () => {
+            filterEpicList(epicSearch.value);
+        });
+    }
+
+    // Epic filter checkbox changes
+    if (epicList) {
+        epicList.addEventListener('change', (event) => {
+            if (event.target && event.target.matches('input[type="checkbox"]')) {
+                applyFilters();
+            }
+        });
+    }
+
+    // Epic drawer functions
+    function escapeHtml(text) {
+        if (!text) return '';
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
+    }
+
+    function getCurrentVersion(versions) {
+        if (!versions || versions.length === 0) return null;
+        // Look for backlog version first (active work version)
+        const backlog = versions.filter(v => v.status === 'backlog');
+        if (backlog.length > 0) {
+            return backlog.reduce((a, b) => (a.version > b.version ? a : b));
+        }
+        // Fall back to highest version number
+        return versions.reduce((a, b) => (a.version > b.version ? a : b));
+    }
+
+    function getStatusColor(status) {
+        const colors = {
+            // Release statuses
+            'planned': '#64748b',
+            'released': '#16a34a',
+            // Artifact lifecycle
+            'active': '#16a34a',
+            'deprecated': '#dc2626',
+            'draft': '#94a3b8',
+            'provisional': '#f59e0b',
+            // Version statuses
+            'backlog': '#2563eb',
+            'discarded': '#9ca3af'
+        };
+        return colors[status] || '#9aa4b2';
+    }
+
+    function formatStatus(status) {
+        return (status || 'unknown').replace(/_/g, ' ');
+    }
+
+    // Connected stories grouped by epic once, so opening the drawer is a lookup
+    const storiesByEpic = new Map();
+    if (typeof storiesData !== 'undefined') {
+        storiesData.forEach((s) => {
+            const key = s.epic_ref || '';
+            let group = storiesByEpic.get(key);
+            if (!group) {
+                group = [];
+                storiesByEpic.set(key, group);
+            }
+            group.push(s);
+        });
+    }
+
+    function getConnectedStories(epicId) {
+        return storiesByEpic.get(epicId) || [];
+    }
+
+    // Connected stories rendered up front; the rest load on demand
+    const STORIES_CHUNK = 50;
+
+    const storyRowTemplate = document.getElementById('story-row-tpl');
+
+    // Clone the row template per story and fill text directly (no HTML parsing)
+    function appendStoryRows(tbody, stories) {
+        if (!tbody || !storyRowTemplate) return;
+        const fragment = document.createDocumentFragment();
+        stories.forEach((s) => {
+            const row = storyRowTemplate.content.firstElementChild.cloneNode(true);
+            const link = row.querySelector('a');
+            link.href = `./${s.id}.html`;
+            link.textContent = s.id;
+            row.cells[1].textContent = s.title || '';
+            const badge = row.querySelector('.status-badge');
+            badge.style.backgroundColor = getStatusColor(s.status);
+            badge.textContent = formatStatus(s.status);
+            fragment.appendChild(row);
+        });
+        tbody.appendChild(fragment);
+    }
+
+    function openEpicDrawer(epicId) {
+        if (!storiesLayout || !epicDrawer || typeof epicData === 'undefined') return;
+        const epic = epicData[epicId];
+        if (!epic) return;
+
+        const currentVersion = getCurrentVersion(epic.versions);
+
+        // Update drawer title with link
+        epicDrawerTitle.innerHTML = `<a href="../epics/${escapeHtml(epic.id)}.html">${escapeHtml(epic.id)}</a>: ${escapeHtml(epic.title)}`;
+
+        // Update meta info
+        if (epic.feature_ref) {
+            epicDrawerMeta.innerHTML = `Feature: <a href="../features/${escapeHtml(epic.feature_ref)}.html">${escapeHtml(epic.feature_ref)}</a>`;
+        } else {
+            epicDrawerMeta.textContent = '';
+        }
+
+        // Build body content
+        let bodyHtml = '';
+        if (currentVersion) {
+            const versionBadge = `<span class="status-badge" style="background-color: #2563eb">v${currentVersion.version}</span>`;
+            bodyHtml += `
+                <div class="epic-drawer-section">
+                    <div class="epic-drawer-section-title">Current Version ${versionBadge}</div>
+                    <div class="epic-drawer-summary">${escapeHtml(currentVersion.summary || 'No summary')}</div>
+                </div>
+            `;
+
+            if (currentVersion.release_ref) {
+                bodyHtml += `
+                    <div class="epic-drawer-section">
+                        <div class="epic-drawer-section-title">Release</div>
+                        <div><a href="../releases/${escapeHtml(currentVersion.release_ref)}.html">${escapeHtml(currentVersion.release_ref)}</a></div>
+                    </div>
+                `;
+            }
+
+            if (currentVersion.assumptions && currentVersion.assumptions.length > 0) {
+                bodyHtml += `
+                    <div class="epic-drawer-section">
+                        <div class="epic-drawer-section-title">Assumptions</div>
+                        <ul>${currentVersion.assumptions.map(a => `<li>${escapeHtml(a)}</li>`).join('')}</ul>
+                    </div>
+                `;
+            }
+
+            if (currentVersion.constraints && currentVersion.constraints.length > 0) {
+                bodyHtml += `
+                    <div class="epic-drawer-section">
+                        <div class="epic-drawer-section-title">Constraints</div>
+                        <ul>${currentVersion.constraints.map(c => `<li>${escapeHtml(c)}</li>`).join('')}</ul>
+                    </div>
+                `;
+            }
+        } else {
+            bodyHtml = '<p>No version information available.</p>';
+        }
+
+        // Add connected stories table
+        const connectedStories = getConnectedStories(epicId);
+        const initialStories = connectedStories.slice(0, STORIES_CHUNK);
+        const remainingCount = connectedStories.length - initialStories.length;
+        bodyHtml += `
+            <div class="epic-drawer-section" style="flex: 1; display: flex; flex-direction: column; min-height: 0;">
+                <div class="epic-drawer-section-title">Connected Stories (${connectedStories.length})</div>
+                <div class="epic-stories-table-wrap">
+                    <div class="epic-stories-table-scroll">
+                        <table class="epic-stories-table">
+                            <colgroup>
+                                <col style="width: 25%;">
+                                <col style="width: 50%;">
+                                <col style="width: 25%;">
+                            </colgroup>
+                            <thead>
+                                <tr>
+                                    <th>Record</th>
+                                    <th>Summary</th>
+                                    <th>Status</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                ${initialStories.length > 0 ? '' : '<tr><td colspan="3" style="text-align: center; color: var(--text-muted); font-style: italic;">No stories in this epic</td></tr>'}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+                ${remainingCount > 0 ? `<button class="button epic-stories-show-more" id="stories-show-more" type="button">Show ${remainingCount} more</button>` : ''}
+            </div>
+        `;
+
+        bodyHtml += `
+            <div class="epic-drawer-section" style="padding-top: 0.5rem; border-top: 1px solid var(--border-color);">
+                <a href="../epics/${escapeHtml(epic.id)}.html" class="button primary">View Full Epic</a>
+            </div>
+        `;
+
+        epicDrawerBody.innerHTML = bodyHtml;
+
+        const storiesBody = epicDrawerBody.querySelector('.epic-stories-table tbody');
+        appendStoryRows(storiesBody, initialStories);
+
+        const showMore = document.getElementById('stories-show-more');
+        if (showMore) {
+            showMore.addEventListener('click', () => {
+                appendStoryRows(storiesBody, connectedStories.slice(STORIES_CHUNK));
+                showMore.remove();
+            });
+        }
+
+        currentOpenEpicId = epicId;
+        storiesLayout.classList.add('drawer-open');
+        epicDrawer.setAttribute('aria-hidden', 'false');
+    }
+
+    // Track currently open epic
+    let currentOpenEpicId = null;
+
+    function closeEpicDrawer() {
+        if (!storiesLayout || !epicDrawer) return;
+        currentOpenEpicId = null;
+        storiesLayout.classList.remove('drawer-open');
+        epicDrawer.setAttribute('aria-hidden', 'true');
+    }
+
+    function isDrawerOpen() {
+        return storiesLayout && storiesLayout.classList.contains('drawer-open');
+    }
+
+    // Epic cell click handlers
+    document.querySelectorAll('.epic-cell-link').forEach(link => {
+        link.addEventListener('click', (event) => {
+            event.preventDefault();
+            const epicId = link.dataset.epicId;
+            if (!epicId) return;
+
+            if (isDrawerOpen() && currentOpenEpicId === epicId) {
+                // Clicking the same epic that's open - close the drawer
+                closeEpicDrawer();
+            } else {
+                // Clicking a different epic or drawer is closed - open/switch to this epic
+                openEpicDrawer(epicId);
+            }
+        });
+    });
+
+    // Close button
+    if (epicDrawerClose) {
+        epicDrawerClose.addEventListener('click', closeEpicDrawer);
+    }
+
+    // Backdrop click
+    if (epicDrawerBackdrop) {
+        epicDrawerBackdrop.addEventListener('click', closeEpicDrawer);
+    }
+
+    // Escape key for drawer
+    document.addEventListener('keydown', (event) => {
+        if (event.key === 'Escape' && storiesLayout && storiesLayout.classList.contains('drawer-open')) {
+            closeEpicDrawer();
+        }
+    });
+
+    // Resize handle
+    if (resizeHandle && storiesLayout) {
+        let isResizing = false;
+        let startX = 0;
+        let startWidth = 450;
+        // Pointer moves are coalesced into one width update per animation frame
+        let pendingX = null;
+        let resizeFrame = 0;
+
+        function applyResize() {
+            resizeFrame = 0;
+            if (!isResizing || pendingX === null) return;
+            const diff = startX - pendingX;
+            const minWidth = 300;
+            const maxWidth = Math.max(600, Math.floor(window.innerWidth * 0.5));
+            const newWidth = Math.max(minWidth, Math.min(maxWidth, startWidth + diff));
+            storiesLayout.style.setProperty('--epic-drawer-width', `${newWidth}px`);
+        }
+
+        function startResize(e) {
+            if (window.innerWidth <= 900) return;
+            e.stopPropagation();
+            e.preventDefault();
+            isResizing = true;
+            startX = e.clientX || (e.touches && e.touches[0] ? e.touches[0].clientX : 0);
+            startWidth = parseInt(getComputedStyle(storiesLayout).getPropertyValue('--epic-drawer-width')) || 450;
+            resizeHandle.classList.add('resizing');
+            document.body.style.cursor = 'ew-resize';
+            document.body.style.userSelect = 'none';
+            document.body.style.pointerEvents = 'none';
+            resizeHandle.style.pointerEvents = 'auto';
+        }
+
+        function doResize(e) {
+            if (!isResizing) return;
+            e.stopPropagation();
+            e.preventDefault();
+            pendingX = e.clientX || (e.touches && e.touches[0] ? e.touches[0].clientX : 0);
+            if (!resizeFrame) {
+                resizeFrame = requestAnimationFrame(applyResize);
+            }
+        }
+
+        function stopResize(e) {
+            if (!isResizing) return;
+            e.stopPropagation();
+            if (resizeFrame) {
+                cancelAnimationFrame(resizeFrame);
+                applyResize();
+            }
+            isResizing = false;
+            pendingX = null;
+            resizeHandle.classList.remove('resizing');
+            document.body.style.cursor = '';
+            document.body.style.userSelect = '';
+            document.body.style.pointerEvents = '';
+            resizeHandle.style.pointerEvents = '';
+        }
+
+        resizeHandle.addEventListener('mousedown', startResize);
+        resizeHandle.addEventListener('touchstart', startResize, { passive: false });
+        window.addEventListener('mousemove', doResize, { passive: false });
+        window.addEventListener('touchmove', doResize, { passive: false });
+        window.addEventListener('mouseup', stopResize);
+        window.addEventListener('touchend', stopResize);
+        window.addEventListener('mouseleave', stopResize);
+    }
+
+    function debounce(fn, ms) {
+        let timer;
+        return (...args) => {
+            clearTimeout(timer);
+            timer = setTimeout(() => fn(...args), ms);
+        };
+    }
+
+    // Typing re-filters after a short pause; dropdown changes apply immediately
+    searchInput.addEventListener('input', debounce(applyFilters, 100));
+    statusFilter.addEventListener('change', applyFilters);
+    applyFilters();
+})();
+</script>
+"""
+
 # Redirect page HTML
 REDIRECT_HTML = """<!DOCTYPE html>
 <html lang="en">
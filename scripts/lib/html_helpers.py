@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from html import escape
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from lib.assets import CSS, TOPBAR_CSS, VERSION_BANNER_HTML
 from lib.config import DOCS_DIR
@@ -15,8 +16,28 @@ from lib.versions import get_current_version
 # Version file path
 VERSION_FILE = DOCS_DIR / "version.json"
 
+# Shared page stylesheet, written once by render_docs.py and linked from every page
+STYLESHEET_HREF = "assets/apsca.css"
+STYLESHEET_FILE = DOCS_DIR / STYLESHEET_HREF
+PAGE_CSS = TOPBAR_CSS + CSS
+
+# Version selector script shared by epic and story pages, written alongside the stylesheet
+VERSION_SELECT_SRC = "assets/version-select.js"
+VERSION_SELECT_FILE = DOCS_DIR / VERSION_SELECT_SRC
+
 TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
 _TEMPLATE_CACHE: Dict[str, str] = {}
+_TEMPLATE_SEGMENTS: Dict[str, List[str]] = {}
+_PLACEHOLDER = re.compile(r"<!--([A-Z0-9_]+)-->")
+
+# Characters html.escape() would replace; most IDs and statuses contain none
+_NEEDS_ESCAPE = re.compile(r"[&<>\"']").search
+
+# Runs of characters not allowed in element IDs, collapsed to "-" by slugify()
+_SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+# Values up to this length (IDs, statuses, version numbers) go through the escape cache
+_SHORT_TEXT_LIMIT = 64
 
 
 def get_build_version() -> str:
@@ -34,9 +55,43 @@ def get_build_version() -> str:
 # HTML Helpers
 # =============================================================================
 
+@lru_cache(maxsize=8192)
+def _escape_short(text: str) -> str:
+    return escape(text) if _NEEDS_ESCAPE(text) else text
+
+
 def e(text: str) -> str:
     """Escape HTML entities."""
-    return escape(str(text)) if text else ""
+    if not text:
+        return ""
+    text = str(text)
+    if len(text) <= _SHORT_TEXT_LIMIT:
+        return _escape_short(text)
+    return escape(text) if _NEEDS_ESCAPE(text) else text
+
+
+def current_version_of(
+    record: Dict,
+    current_versions: Optional[Dict[str, Optional[Dict]]] = None,
+) -> Optional[Dict]:
+    """Return get_current_version() for a record, taken from current_versions when it has the record."""
+    if current_versions is not None:
+        record_id = record.get("id")
+        if record_id in current_versions:
+            return current_versions[record_id]
+    versions = record.get("versions")
+    if not versions:
+        return None
+    return get_current_version(versions)
+
+
+def build_current_versions(*collections: List[Dict]) -> Dict[str, Optional[Dict]]:
+    """Resolve the current version of every versioned record once, keyed by ID."""
+    return {
+        record["id"]: current_version_of(record)
+        for records in collections
+        for record in records
+    }
 
 
 def load_template(name: str) -> str:
@@ -49,17 +104,38 @@ def load_template(name: str) -> str:
     return content
 
 
-def render_template(name: str, replacements: Dict[str, str]) -> str:
-    """Render a template by replacing <!--TOKEN--> placeholders."""
-    content = load_template(name)
-    for key, value in replacements.items():
-        placeholder = f"<!--{key}-->"
-        if placeholder not in content:
-            raise ValueError(f"Missing placeholder {placeholder} in template {name}")
-        content = content.replace(placeholder, value, 1)
-    return content
+def load_template_segments(name: str) -> List[str]:
+    """Split a template into alternating literal text and placeholder names, cached."""
+    segments = _TEMPLATE_SEGMENTS.get(name)
+    if segments is None:
+        segments = _PLACEHOLDER.split(load_template(name))
+        _TEMPLATE_SEGMENTS[name] = segments
+    return segments
+
 
+def render_template(name: str, replacements: Dict[str, str]) -> str:
+    """Render a template by replacing <!--TOKEN--> placeholders.
 
+    Each token's first occurrence is replaced; the page is assembled in a single join.
+    """
+    segments = load_template_segments(name)
+    parts = [segments[0]]
+    used = set()
+    for index in range(1, len(segments), 2):
+        key = segments[index]
+        if key in replacements and key not in used:
+            parts.append(replacements[key])
+            used.add(key)
+        else:
+            parts.append(f"<!--{key}-->")
+        parts.append(segments[index + 1])
+    if len(used) != len(replacements):
+        missing = next(key for key in replacements if key not in used)
+        raise ValueError(f"Missing placeholder <!--{missing}--> in template {name}")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=64)
 def format_status_label(status: str) -> str:
     """Format a status string for display."""
     if not status:
@@ -67,48 +143,51 @@ def format_status_label(status: str) -> str:
     return status.replace("_", " ").title()
 
 
+# Badge background per status; anything else falls back to neutral gray
+STATUS_COLORS = {
+    # Release statuses
+    "planned": "#64748b",      # Gray
+    "released": "#16a34a",     # Green
+    # Artifact lifecycle
+    "active": "#16a34a",       # Green
+    "deprecated": "#dc2626",   # Red
+    "draft": "#94a3b8",        # Light gray
+    "provisional": "#f59e0b",  # Amber
+    # Version statuses
+    "backlog": "#2563eb",      # Blue
+    "discarded": "#9ca3af",    # Gray
+}
+
+
+@lru_cache(maxsize=64)
 def status_badge(status: str) -> str:
     """Generate status badge HTML."""
-    colors = {
-        # Release statuses
-        "planned": "#64748b",      # Gray
-        "released": "#16a34a",     # Green
-        # Artifact lifecycle
-        "active": "#16a34a",       # Green
-        "deprecated": "#dc2626",   # Red
-        "draft": "#94a3b8",        # Light gray
-        "provisional": "#f59e0b",  # Amber
-        # Version statuses
-        "backlog": "#2563eb",      # Blue
-        "discarded": "#9ca3af",    # Gray
-    }
-    color = colors.get(status, "#6b7280")
+    color = STATUS_COLORS.get(status, "#6b7280")
     label = format_status_label(status)
     return f'<span class="status-badge" style="background-color: {color}">{e(label)}</span>'
 
 
+# Badge background per business artifact type; unknown types fall back to neutral gray
+ARTIFACT_TYPE_COLORS = {
+    "policy": "#3b82f6",
+    "catalog": "#10b981",
+    "classification": "#8b5cf6",
+    "rule": "#f59e0b",
+}
+
+
+@lru_cache(maxsize=64)
+def type_badge(artifact_type: str) -> str:
+    """Generate badge HTML for a single business artifact type."""
+    color = ARTIFACT_TYPE_COLORS.get(artifact_type, "#6b7280")
+    return f'<span class="status-badge" style="background-color: {color}">{e(format_status_label(artifact_type))}</span>'
+
+
 def artifact_type_badge(dom_type) -> str:
     """Generate badge HTML for business artifact types. Handles both string and array of types."""
     if isinstance(dom_type, list):
         dom_type = dom_type[0] if dom_type else "unknown"
-    type_colors = {
-        "policy": "#3b82f6",
-        "catalog": "#10b981",
-        "classification": "#8b5cf6",
-        "rule": "#f59e0b",
-    }
-
-    # Handle array of types
-    if isinstance(dom_type, list):
-        badges = []
-        for t in dom_type:
-            type_color = type_colors.get(t, "#6b7280")
-            badges.append(f'<span class="status-badge" style="background-color: {type_color}">{e(format_status_label(t))}</span>')
-        return " ".join(badges)
-
-    # Handle single string type
-    type_color = type_colors.get(dom_type, "#6b7280")
-    return f'<span class="status-badge" style="background-color: {type_color}">{e(format_status_label(dom_type))}</span>'
+    return type_badge(dom_type)
 
 
 def format_refs_html(refs: List[str], prefix: str = "") -> str:
@@ -148,16 +227,12 @@ def format_secondary(text: str) -> str:
     return f'<div class="cell-secondary">{e(text)}</div>' if text else ""
 
 
-def render_connected_table(headers: List[str], rows: List[List[str]], empty_label: str) -> str:
-    """Render a compact table for connected records with an empty-state row."""
-    header_html = "".join(f"<th>{e(header)}</th>" for header in headers)
-    if rows:
-        body_html = "".join("<tr>" + "".join(cells) + "</tr>" for cells in rows)
-    else:
-        body_html = (
-            f'<tr><td class="empty-cell" colspan="{len(headers)}">'
-            f"<em>There are no {e(empty_label)} to display.</em></td></tr>"
-        )
+@lru_cache(maxsize=32)
+def _connected_table_head(headers: Tuple[str, ...]) -> str:
+    return "".join([f"<th>{e(header)}</th>" for header in headers])
+
+
+def _connected_table(header_html: str, body_html: str) -> str:
     return (
         '<table class="connected-table">'
         f"<thead><tr>{header_html}</tr></thead>"
@@ -166,6 +241,26 @@ def render_connected_table(headers: List[str], rows: List[List[str]], empty_labe
     )
 
 
+@lru_cache(maxsize=64)
+def _empty_connected_table(headers: Tuple[str, ...], empty_label: str) -> str:
+    return _connected_table(
+        _connected_table_head(headers),
+        f'<tr><td class="empty-cell" colspan="{len(headers)}">'
+        f"<em>There are no {e(empty_label)} to display.</em></td></tr>",
+    )
+
+
+def render_connected_table(headers: Tuple[str, ...], rows: List[List[str]], empty_label: str) -> str:
+    """Render a compact table for connected records with an empty-state row.
+
+    Empty tables depend only on their headers and label, so they are built once and reused.
+    """
+    if not rows:
+        return _empty_connected_table(tuple(headers), empty_label)
+    body_html = "".join(["<tr>" + "".join(cells) + "</tr>" for cells in rows])
+    return _connected_table(_connected_table_head(tuple(headers)), body_html)
+
+
 def render_tabs(group_id: str, tabs: List[Dict[str, str]]) -> str:
     """Render a tabbed UI with panels."""
     if not tabs:
@@ -196,9 +291,10 @@ def render_tabs(group_id: str, tabs: List[Dict[str, str]]) -> str:
     )
 
 
+@lru_cache(maxsize=256)
 def slugify(text: str) -> str:
     """Create a safe ID string for HTML elements."""
-    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    slug = _SLUG_SEPARATORS.sub("-", text.lower()).strip("-")
     return slug or "tab"
 
 
@@ -240,12 +336,17 @@ def build_feature_rows(features: List[Dict], prefix: str) -> List[List[str]]:
     return rows
 
 
-def build_epic_rows(epics: List[Dict], epic_prefix: str, release_prefix: str) -> List[List[str]]:
+def build_epic_rows(
+    epics: List[Dict],
+    epic_prefix: str,
+    release_prefix: str,
+    current_versions: Optional[Dict[str, Optional[Dict]]] = None,
+) -> List[List[str]]:
     rows = []
     for epic in epics:
         epic_id = epic.get("id", "")
         title = epic.get("title", "")
-        current = get_current_version(epic.get("versions", []))
+        current = current_version_of(epic, current_versions)
         summary = current.get("summary", "No summary") if current else "No versions recorded"
         release_ref = current.get("release_ref") if current else None
         rows.append(
@@ -258,12 +359,17 @@ def build_epic_rows(epics: List[Dict], epic_prefix: str, release_prefix: str) ->
     return rows
 
 
-def build_story_rows(stories: List[Dict], story_prefix: str, release_prefix: str) -> List[List[str]]:
+def build_story_rows(
+    stories: List[Dict],
+    story_prefix: str,
+    release_prefix: str,
+    current_versions: Optional[Dict[str, Optional[Dict]]] = None,
+) -> List[List[str]]:
     rows = []
     for story in stories:
         story_id = story.get("id", "")
         title = story.get("title", "")
-        current = get_current_version(story.get("versions", []))
+        current = current_version_of(story, current_versions)
         description = current.get("description", "No description") if current else "No versions recorded"
         release_ref = current.get("release_ref") if current else None
         rows.append(
@@ -276,35 +382,89 @@ def build_story_rows(stories: List[Dict], story_prefix: str, release_prefix: str
     return rows
 
 
-def build_requirement_rows(requirement_refs: List[str], requirement_lookup: Dict[str, Dict], prefix: str) -> List[List[str]]:
+def build_requirement_row(ref: str, req: Dict, prefix: str) -> List[str]:
+    title = req.get("title", "")
+    statement = req.get("statement", "No statement")
+    return [
+        render_record_cell(ref, title, prefix),
+        render_summary_cell(statement),
+    ]
+
+
+def build_requirement_row_cache(
+    requirement_lookup: Dict[str, Dict],
+    prefix: str,
+) -> Dict[str, Dict[str, List[str]]]:
+    """Render the connected-table cells for every requirement once, keyed by prefix, then ID."""
+    return {prefix: {ref: build_requirement_row(ref, req, prefix) for ref, req in requirement_lookup.items()}}
+
+
+def build_artifact_row(ref: str, artifact: Dict, prefix: str) -> List[str]:
+    title = artifact.get("title", "")
+    description = artifact.get("description", "Business artifact")
+    dom_type = artifact.get("type", "unknown")
+    return [
+        render_record_cell(ref, title, prefix),
+        render_summary_cell(description),
+        f'<td class="status-cell"><div class="badge-stack">{artifact_type_badge(dom_type)}</div></td>',
+    ]
+
+
+def build_artifact_row_cache(
+    artifact_lookup: Dict[str, Dict],
+    prefix: str,
+) -> Dict[str, Dict[str, List[str]]]:
+    """Render the connected-table cells for every business artifact once, keyed by prefix, then ID."""
+    return {prefix: {ref: build_artifact_row(ref, artifact, prefix) for ref, artifact in artifact_lookup.items()}}
+
+
+def render_release_link(release_ref: Optional[str], prefix: str) -> str:
+    if release_ref:
+        return f'<a href="{prefix}{e(release_ref)}.html">{e(release_ref)}</a>'
+    return "Unassigned"
+
+
+def build_release_links(releases: List[Dict], prefix: str) -> Dict[Optional[str], str]:
+    """Render the release link for every release once, keyed by ID (None/"" map to Unassigned)."""
+    links: Dict[Optional[str], str] = {None: "Unassigned", "": "Unassigned"}
+    for release in releases:
+        release_id = release.get("id")
+        if release_id:
+            links[release_id] = render_release_link(release_id, prefix)
+    return links
+
+
+def build_requirement_rows(
+    requirement_refs: List[str],
+    requirement_lookup: Dict[str, Dict],
+    prefix: str,
+    row_cache: Optional[Dict[str, Dict[str, List[str]]]] = None,
+) -> List[List[str]]:
+    # Cached cells embed the prefix they were rendered with, so only reuse a matching one
+    cached = row_cache.get(prefix) if row_cache else None
     rows = []
-    for ref in requirement_refs or []:
-        req = requirement_lookup.get(ref, {})
-        title = req.get("title", "")
-        statement = req.get("statement", "No statement")
-        rows.append(
-            [
-                render_record_cell(ref, title, prefix),
-                render_summary_cell(statement),
-            ]
-        )
+    for ref in requirement_refs or ():
+        cells = cached.get(ref) if cached else None
+        if cells is None:
+            cells = build_requirement_row(ref, requirement_lookup.get(ref, {}), prefix)
+        rows.append(cells)
     return rows
 
 
-def build_artifact_rows(artifact_refs: List[str], artifact_lookup: Dict[str, Dict], prefix: str) -> List[List[str]]:
+def build_artifact_rows(
+    artifact_refs: List[str],
+    artifact_lookup: Dict[str, Dict],
+    prefix: str,
+    row_cache: Optional[Dict[str, Dict[str, List[str]]]] = None,
+) -> List[List[str]]:
+    # Cached cells embed the prefix they were rendered with, so only reuse a matching one
+    cached = row_cache.get(prefix) if row_cache else None
     rows = []
-    for ref in artifact_refs or []:
-        artifact = artifact_lookup.get(ref, {})
-        title = artifact.get("title", "")
-        description = artifact.get("description", "Business artifact")
-        dom_type = artifact.get("type", "unknown")
-        rows.append(
-            [
-                render_record_cell(ref, title, prefix),
-                render_summary_cell(description),
-                f'<td class="status-cell"><div class="badge-stack">{artifact_type_badge(dom_type)}</div></td>',
-            ]
-        )
+    for ref in artifact_refs or ():
+        cells = cached.get(ref) if cached else None
+        if cells is None:
+            cells = build_artifact_row(ref, artifact_lookup.get(ref, {}), prefix)
+        rows.append(cells)
     return rows
 
 
@@ -313,6 +473,7 @@ def build_artifact_rows(artifact_refs: List[str], artifact_lookup: Dict[str, Dic
 # =============================================================================
 
 
+@lru_cache(maxsize=32)
 def generate_navbar(active_section: str = "", depth: int = 1) -> str:
     """Generate standardized navbar HTML."""
     prefix = "../" * depth
@@ -346,27 +507,28 @@ def generate_navbar(active_section: str = "", depth: int = 1) -> str:
 """
 
 
-def html_page(title: str, content: str, active_section: str = "", depth: int = 1, custom_main: bool = False) -> str:
-    """Wrap content in full HTML page with navigation.
+@lru_cache(maxsize=8)
+def version_select_script(depth: int) -> str:
+    """Return the <script> tag loading the shared version selector from a page at depth."""
+    src = f"{'../' * depth}{VERSION_SELECT_SRC}"
+    build_version = get_build_version()
+    if build_version:
+        src += f"?v={build_version}"
+    return f'<script src="{e(src)}"></script>\n'
 
-    Args:
-        title: Page title
-        content: HTML content
-        active_section: Active nav section
-        depth: URL depth for relative paths
-        custom_main: If True, don't wrap content in <main> tags (for custom layouts)
+
+@lru_cache(maxsize=32)
+def page_chrome(active_section: str, depth: int) -> Tuple[str, str, str, str]:
+    """Return the per-page constants for html_page(), cached per (active_section, depth).
+
+    Returns (build_version, stylesheet_href, nav_html, page_scripts).
     """
     nav_html = generate_navbar(active_section, depth)
-    breadcrumb_html = '<nav id="breadcrumb-nav" class="breadcrumb-nav" aria-label="Breadcrumb"></nav>'
     prefix = "../" * depth
     build_version = get_build_version()
-
-    version_banner = VERSION_BANNER_HTML
-
-    if custom_main:
-        main_section = content
-    else:
-        main_section = f"<main>\n        {breadcrumb_html}\n        {content}\n    </main>"
+    stylesheet_href = f"{prefix}{STYLESHEET_HREF}"
+    if build_version:
+        stylesheet_href += f"?v={build_version}"
 
     page_scripts = f"""<script>
     (() => {{
@@ -675,13 +837,35 @@ def html_page(title: str, content: str, active_section: str = "", depth: int = 1
         return {{ checkVersion }};
     }})();
     </script>"""
+    return build_version, stylesheet_href, nav_html, page_scripts
+
+
+def html_page(title: str, content: str, active_section: str = "", depth: int = 1, custom_main: bool = False) -> str:
+    """Wrap content in full HTML page with navigation.
+
+    Args:
+        title: Page title
+        content: HTML content
+        active_section: Active nav section
+        depth: URL depth for relative paths
+        custom_main: If True, don't wrap content in <main> tags (for custom layouts)
+    """
+    build_version, stylesheet_href, nav_html, page_scripts = page_chrome(active_section, depth)
+    breadcrumb_html = '<nav id="breadcrumb-nav" class="breadcrumb-nav" aria-label="Breadcrumb"></nav>'
+
+    version_banner = VERSION_BANNER_HTML
+
+    if custom_main:
+        main_section = content
+    else:
+        main_section = f"<main>\n        {breadcrumb_html}\n        {content}\n    </main>"
 
     return render_template(
         "page.html",
         {
             "BUILD_VERSION": e(build_version),
             "TITLE": e(title),
-            "CSS": TOPBAR_CSS + CSS,
+            "STYLESHEET": e(stylesheet_href),
             "VERSION_BANNER": version_banner,
             "NAVBAR": nav_html,
             "MAIN": main_section,
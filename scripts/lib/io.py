@@ -11,7 +11,7 @@ def load_json(file_path: Path) -> List[Dict]:
     """Load JSON array from file. Returns empty list if file is empty or missing."""
     if not file_path.exists():
         return []
-    content = file_path.read_text(encoding="utf-8").strip()
+    content = file_path.read_bytes().strip()
     if not content:
         return []
     return json.loads(content)
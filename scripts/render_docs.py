@@ -9,16 +9,29 @@ Usage:
     python scripts/render_docs.py
 """
 
+import os
 import shutil
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
 
+from lib.assets import VERSION_SELECT_JS
 from lib.config import DATA_FILES, DATA_DIR, DOCS_DIR, REPORTS_DIR, ROOT_DIR
+from lib.html_helpers import (
+    PAGE_CSS,
+    STYLESHEET_FILE,
+    VERSION_SELECT_FILE,
+    build_artifact_row_cache,
+    build_release_links,
+    build_current_versions,
+    build_requirement_row_cache,
+    current_version_of,
+)
 from lib.io import load_json
 from renderers.artifacts import render_artifact_entry
 from renderers.epics import render_epic
 from renderers.features import render_feature
 from renderers.index_pages import render_artifacts_index, render_index, render_index_redirect
-from renderers.releases import render_release
+from renderers.releases import index_versions_by_release, render_release
 from renderers.requirements import render_requirement
 from renderers.stories import render_story
 from renderers.definitions import render_definitions
@@ -34,6 +47,107 @@ OUTPUT_DIRS = {
 }
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def is_up_to_date(source: Union[Path, os.DirEntry], target: Path) -> bool:
+    """Return True if target exists, matches source in size, and is not older."""
+    try:
+        target_stat = target.stat()
+    except FileNotFoundError:
+        return False
+    source_stat = source.stat()
+    return target_stat.st_size == source_stat.st_size and target_stat.st_mtime >= source_stat.st_mtime
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    """Hardlink source to target, falling back to a byte copy (e.g. across filesystems)."""
+    try:
+        target.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def sync_files(source_dir: Path, target_dir: Path, suffix: str = "") -> None:
+    """Mirror the files in source_dir (optionally only those ending in suffix) into target_dir."""
+    try:
+        entries = os.scandir(source_dir)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(suffix) or not entry.is_file():
+                continue
+            target = target_dir / entry.name
+            if not is_up_to_date(entry, target):
+                link_or_copy(Path(entry.path), target)
+
+
+def index_by_refs(records: List[Dict], get_refs: Callable[[Dict], Optional[Sequence[str]]]) -> Dict[str, List[Dict]]:
+    """Map each referenced ID to the records that reference it, in record order."""
+    index: Dict[str, List[Dict]] = {}
+    for record in records:
+        for ref in dict.fromkeys(get_refs(record) or ()):
+            index.setdefault(ref, []).append(record)
+    return index
+
+
+def current_artifact_refs(
+    record: Dict,
+    current_versions: Optional[Dict[str, Optional[Dict]]] = None,
+) -> Sequence[str]:
+    """Artifact refs of a versioned record's current version."""
+    return (current_version_of(record, current_versions) or {}).get("artifact_refs", ())
+
+
+def current_requirement_refs(
+    record: Dict,
+    current_versions: Optional[Dict[str, Optional[Dict]]] = None,
+) -> Sequence[str]:
+    """Requirement refs of a versioned record's current version."""
+    return (current_version_of(record, current_versions) or {}).get("requirement_refs", ())
+
+
+def write_page(path: Path, content: str) -> bool:
+    """Write a rendered page as UTF-8 bytes straight to a raw file descriptor.
+
+    Pages whose bytes are already on disk are left untouched (keeping their mtime).
+    Returns True if the file was written.
+    """
+    encoded = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(encoded) and path.read_bytes() == encoded:
+            return False
+    except FileNotFoundError:
+        pass
+    data = memoryview(encoded)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    return True
+
+
+def remove_stale_pages(output_dir: Path, records: List[Dict], id_prefix: str) -> None:
+    """Delete generated <id_prefix>-*.html record pages whose record no longer exists in the data.
+
+    Only pages named like a record ID are touched, so authored files sharing the
+    directory (e.g. docs/artifacts/) are never removed.
+    """
+    expected = {f"{record['id']}.html" for record in records}
+    for page in output_dir.glob(f"{id_prefix}-*.html"):
+        if page.name not in expected:
+            page.unlink()
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -51,16 +165,52 @@ def main():
     # Build lookup tables
     artifact_lookup = {artifact['id']: artifact for artifact in artifacts}
     requirement_lookup = {r['id']: r for r in requirements}
+    epic_lookup = {ep['id']: ep for ep in epics}
 
-    # Ensure output directories exist
-    for output_dir in OUTPUT_DIRS.values():
+    # Parent -> children indexes so detail pages don't rescan every list
+    epics_by_feature = {}
+    for epic in epics:
+        epics_by_feature.setdefault(epic.get("feature_ref"), []).append(epic)
+    stories_by_epic = {}
+    stories_by_feature = {}
+    for story in stories:
+        epic_ref = story.get("epic_ref")
+        stories_by_epic.setdefault(epic_ref, []).append(story)
+        parent_epic = epic_lookup.get(epic_ref) if epic_ref else None
+        if parent_epic:
+            stories_by_feature.setdefault(parent_epic.get("feature_ref"), []).append(story)
+
+    # Requirement and artifact rows look the same on every page that links to them
+    requirement_row_cache = build_requirement_row_cache(requirement_lookup, "../requirements/")
+    artifact_row_cache = build_artifact_row_cache(artifact_lookup, "../artifacts/")
+    release_links = build_release_links(releases, "../releases/")
+
+    # Resolve each epic's and story's current version once for every page that reads it
+    current_versions = build_current_versions(epics, stories)
+
+    # Ensure every output directory exists, once, before any page is written
+    releases_dir = OUTPUT_DIRS["releases"]
+    requirements_dir = OUTPUT_DIRS["requirements"]
+    features_dir = OUTPUT_DIRS["features"]
+    epics_dir = OUTPUT_DIRS["epics"]
+    stories_dir = OUTPUT_DIRS["stories"]
+    artifacts_dir = DOCS_DIR / "artifacts"
+    docs_data = DOCS_DIR / "data"
+    docs_reports = DOCS_DIR / "reports"
+    for output_dir in (*OUTPUT_DIRS.values(), artifacts_dir, STYLESHEET_FILE.parent, docs_data, docs_reports):
         output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Shared stylesheet linked from every html_page() page, and the epic/story version selector
+    write_page(STYLESHEET_FILE, PAGE_CSS)
+    write_page(VERSION_SELECT_FILE, VERSION_SELECT_JS)
+
     counts = {"releases": 0, "artifacts": 0, "requirements": 0, "features": 0, "epics": 0, "stories": 0}
 
     # Render business artifacts and index
-    artifacts_dir = DOCS_DIR / "artifacts"
-    artifacts_dir.mkdir(parents=True, exist_ok=True)
+    features_by_artifact = index_by_refs(features, lambda feat: feat.get("artifact_refs"))
+    epics_by_artifact = index_by_refs(epics, lambda rec: current_artifact_refs(rec, current_versions))
+    stories_by_artifact = index_by_refs(stories, lambda rec: current_artifact_refs(rec, current_versions))
+    requirements_by_artifact = index_by_refs(requirements, lambda req: req.get("artifact_refs"))
     for entry in artifacts:
         content = render_artifact_entry(
             entry,
@@ -69,11 +219,17 @@ def main():
             stories,
             requirements,
             requirement_lookup=requirement_lookup,
+            requirement_row_cache=requirement_row_cache,
+            features_by_artifact=features_by_artifact,
+            epics_by_artifact=epics_by_artifact,
+            stories_by_artifact=stories_by_artifact,
+            requirements_by_artifact=requirements_by_artifact,
+            current_versions=current_versions,
         )
-        (artifacts_dir / f"{entry['id']}.html").write_text(content, encoding="utf-8")
+        write_page(artifacts_dir / f"{entry['id']}.html", content)
         counts["artifacts"] += 1
     artifacts_index = render_artifacts_index(artifacts)
-    (artifacts_dir / "index.html").write_text(artifacts_index, encoding="utf-8")
+    write_page(artifacts_dir / "index.html", artifacts_index)
 
     # Render releases
     releases_sorted = sorted(
@@ -82,15 +238,26 @@ def main():
         reverse=True,
     )
     release_items = releases_sorted
+    epic_versions_by_release = index_versions_by_release(epics, "summary")
+    story_versions_by_release = index_versions_by_release(stories, "description")
     for release in release_items:
-        content = render_release(release, epics, stories)
-        (OUTPUT_DIRS["releases"] / f"{release['id']}.html").write_text(content, encoding="utf-8")
+        content = render_release(
+            release,
+            epics,
+            stories,
+            epic_versions_by_release=epic_versions_by_release,
+            story_versions_by_release=story_versions_by_release,
+        )
+        write_page(releases_dir / f"{release['id']}.html", content)
         counts["releases"] += 1
 
     index_content = render_index("releases", release_items, "Releases")
-    (OUTPUT_DIRS["releases"] / "index.html").write_text(index_content, encoding="utf-8")
+    write_page(releases_dir / "index.html", index_content)
 
     # Render requirements
+    features_by_requirement = index_by_refs(features, lambda feat: feat.get("requirement_refs"))
+    epics_by_requirement = index_by_refs(epics, lambda rec: current_requirement_refs(rec, current_versions))
+    stories_by_requirement = index_by_refs(stories, lambda rec: current_requirement_refs(rec, current_versions))
     for req in requirements:
         content = render_requirement(
             req,
@@ -98,12 +265,17 @@ def main():
             epics,
             stories,
             artifact_lookup=artifact_lookup,
+            artifact_row_cache=artifact_row_cache,
+            features_by_requirement=features_by_requirement,
+            epics_by_requirement=epics_by_requirement,
+            stories_by_requirement=stories_by_requirement,
+            current_versions=current_versions,
         )
-        (OUTPUT_DIRS["requirements"] / f"{req['id']}.html").write_text(content, encoding="utf-8")
+        write_page(requirements_dir / f"{req['id']}.html", content)
         counts["requirements"] += 1
 
     index_content = render_index("requirements", requirements, "Requirements", artifact_lookup=artifact_lookup)
-    (OUTPUT_DIRS["requirements"] / "index.html").write_text(index_content, encoding="utf-8")
+    write_page(requirements_dir / "index.html", index_content)
 
     # Render features
     for feat in features:
@@ -113,12 +285,17 @@ def main():
             stories,
             requirement_lookup=requirement_lookup,
             artifact_lookup=artifact_lookup,
+            requirement_row_cache=requirement_row_cache,
+            artifact_row_cache=artifact_row_cache,
+            epics_by_feature=epics_by_feature,
+            stories_by_feature=stories_by_feature,
+            current_versions=current_versions,
         )
-        (OUTPUT_DIRS["features"] / f"{feat['id']}.html").write_text(content, encoding="utf-8")
+        write_page(features_dir / f"{feat['id']}.html", content)
         counts["features"] += 1
 
     index_content = render_index("features", features, "Features")
-    (OUTPUT_DIRS["features"] / "index.html").write_text(index_content, encoding="utf-8")
+    write_page(features_dir / "index.html", index_content)
 
     # Render epics
     for epic in epics:
@@ -127,12 +304,17 @@ def main():
             stories,
             requirement_lookup=requirement_lookup,
             artifact_lookup=artifact_lookup,
+            requirement_row_cache=requirement_row_cache,
+            artifact_row_cache=artifact_row_cache,
+            release_links=release_links,
+            stories_by_epic=stories_by_epic,
+            current_versions=current_versions,
         )
-        (OUTPUT_DIRS["epics"] / f"{epic['id']}.html").write_text(content, encoding="utf-8")
+        write_page(epics_dir / f"{epic['id']}.html", content)
         counts["epics"] += 1
 
-    index_content = render_index("epics", epics, "Epics")
-    (OUTPUT_DIRS["epics"] / "index.html").write_text(index_content, encoding="utf-8")
+    index_content = render_index("epics", epics, "Epics", current_versions=current_versions)
+    write_page(epics_dir / "index.html", index_content)
 
     # Render stories
     for story in stories:
@@ -142,45 +324,47 @@ def main():
             features,
             requirement_lookup=requirement_lookup,
             artifact_lookup=artifact_lookup,
+            requirement_row_cache=requirement_row_cache,
+            artifact_row_cache=artifact_row_cache,
+            release_links=release_links,
+            epic_lookup=epic_lookup,
+            current_versions=current_versions,
         )
-        (OUTPUT_DIRS["stories"] / f"{story['id']}.html").write_text(content, encoding="utf-8")
+        write_page(stories_dir / f"{story['id']}.html", content)
         counts["stories"] += 1
 
-    epic_lookup = {ep['id']: ep for ep in epics}
-    index_content = render_index("stories", stories, "Stories", epic_lookup=epic_lookup)
-    (OUTPUT_DIRS["stories"] / "index.html").write_text(index_content, encoding="utf-8")
+    index_content = render_index("stories", stories, "Stories", epic_lookup=epic_lookup, current_versions=current_versions)
+    write_page(stories_dir / "index.html", index_content)
 
     # Render index.html as redirect to Story Map
     index_redirect = render_index_redirect()
-    (DOCS_DIR / "index.html").write_text(index_redirect, encoding="utf-8")
+    write_page(DOCS_DIR / "index.html", index_redirect)
 
     # Render story-map.html from template
     story_map_content = render_story_map()
-    (DOCS_DIR / "story-map.html").write_text(story_map_content, encoding="utf-8")
+    write_page(DOCS_DIR / "story-map.html", story_map_content)
 
     # Render definitions.html
     definitions_content = render_definitions()
-    (DOCS_DIR / "definitions.html").write_text(definitions_content, encoding="utf-8")
+    write_page(DOCS_DIR / "definitions.html", definitions_content)
 
-    # Copy data and reports to docs for local testing and story map access
-    docs_data = DOCS_DIR / "data"
-    docs_reports = DOCS_DIR / "reports"
-    docs_data.mkdir(exist_ok=True)
-    docs_reports.mkdir(exist_ok=True)
+    # Drop pages for records that were removed from the data
+    remove_stale_pages(artifacts_dir, artifacts, "ART")
+    remove_stale_pages(releases_dir, releases, "REL")
+    remove_stale_pages(requirements_dir, requirements, "REQ")
+    remove_stale_pages(features_dir, features, "FEAT")
+    remove_stale_pages(epics_dir, epics, "EPIC")
+    remove_stale_pages(stories_dir, stories, "STORY")
 
-    for json_file in DATA_DIR.glob("*.json"):
-        shutil.copy(json_file, docs_data / json_file.name)
-
-    for json_file in REPORTS_DIR.glob("*.json"):
-        shutil.copy(json_file, docs_reports / json_file.name)
+    # Copy data and reports to docs for local testing and story map access
+    sync_files(DATA_DIR, docs_data, ".json")
+    sync_files(REPORTS_DIR, docs_reports, ".json")
 
     images_dir = ROOT_DIR / "images"
-    docs_images = DOCS_DIR / "images"
     if images_dir.exists():
+        docs_images = DOCS_DIR / "images"
         docs_images.mkdir(exist_ok=True)
-        for image_file in images_dir.iterdir():
-            if image_file.is_file():
-                shutil.copy(image_file, docs_images / image_file.name)
+        sync_files(images_dir, docs_images)
 
     print("Documentation generated:")
     for key, count in counts.items():
@@ -7,15 +7,15 @@ from lib.html_helpers import (
     build_feature_rows,
     build_requirement_rows,
     build_story_rows,
+    current_version_of,
     e,
-    format_status_label,
     html_page,
     render_connected_table,
     render_tabs,
     slugify,
     status_badge,
+    type_badge,
 )
-from lib.versions import get_current_version
 
 
 def render_artifact_entry(
@@ -25,23 +25,21 @@ def render_artifact_entry(
     stories: List[Dict],
     requirements: List[Dict],
     requirement_lookup: Optional[Dict[str, Dict]] = None,
+    requirement_row_cache: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    features_by_artifact: Optional[Dict[str, List[Dict]]] = None,
+    epics_by_artifact: Optional[Dict[str, List[Dict]]] = None,
+    stories_by_artifact: Optional[Dict[str, List[Dict]]] = None,
+    requirements_by_artifact: Optional[Dict[str, List[Dict]]] = None,
+    current_versions: Optional[Dict[str, Optional[Dict]]] = None,
 ) -> str:
     """Render a single business artifact entry as HTML."""
     artifact_type = entry.get("type", "unknown")
     if isinstance(artifact_type, list):
         artifact_type = artifact_type[0] if artifact_type else "unknown"
-    type_colors = {
-        "policy": "#3b82f6",
-        "catalog": "#10b981",
-        "classification": "#8b5cf6",
-        "rule": "#f59e0b",
-    }
-    type_color = type_colors.get(artifact_type, "#6b7280")
-
-    html = f"""
+    parts = [f"""
 <h1>{e(entry['id'])}: {e(entry.get('title', ''))}</h1>
 <div class="meta">
-    <strong>Type:</strong> <span class="status-badge" style="background-color: {type_color}">{e(format_status_label(artifact_type))}</span> &nbsp;
+    <strong>Type:</strong> {type_badge(artifact_type)} &nbsp;
     {status_badge(entry.get('status', 'unknown'))} &nbsp;
     <strong>Source:</strong> {e(entry.get('source', 'unknown'))}
     {f' &nbsp; <strong>Effective:</strong> {e(entry.get("effective_date"))}' if entry.get('effective_date') else ''}
@@ -50,73 +48,79 @@ def render_artifact_entry(
     <h2>Description</h2>
     <p>{e(entry.get('description', 'No description provided.'))}</p>
 </div>
-"""
+"""]
     if entry.get("anchors"):
-        html += '<div class="section"><h2>Anchors</h2><ul>'
-        for anchor in entry["anchors"]:
-            html += f"<li>{e(anchor)}</li>"
-        html += "</ul></div>"
+        parts.append('<div class="section"><h2>Anchors</h2><ul>')
+        parts.extend([f"<li>{e(anchor)}</li>" for anchor in entry["anchors"]])
+        parts.append("</ul></div>")
 
     if entry.get("notes"):
-        html += f'<div class="section"><h2>Notes</h2><p>{e(entry["notes"])}</p></div>'
+        parts.append(f'<div class="section"><h2>Notes</h2><p>{e(entry["notes"])}</p></div>')
 
     if entry.get("tags"):
-        html += f'<p><strong>Tags:</strong> {", ".join(e(t) for t in entry["tags"])}</p>'
+        parts.append(f'<p><strong>Tags:</strong> {", ".join(map(e, entry["tags"]))}</p>')
 
     artifact_id = entry.get("id")
-    feature_rows = build_feature_rows(
-        [feat for feat in features if artifact_id in (feat.get("artifact_refs") or [])],
-        "../features/",
-    )
-    epic_rows = build_epic_rows(
-        [
+    if features_by_artifact is not None:
+        artifact_features = features_by_artifact.get(artifact_id, ())
+    else:
+        artifact_features = [feat for feat in features if artifact_id in (feat.get("artifact_refs") or [])]
+    if epics_by_artifact is not None:
+        artifact_epics = epics_by_artifact.get(artifact_id, ())
+    else:
+        artifact_epics = [
             epic
             for epic in epics
-            if artifact_id in ((get_current_version(epic.get("versions", [])) or {}).get("artifact_refs", []))
-        ],
-        "../epics/",
-        "../releases/",
-    )
-    story_rows = build_story_rows(
-        [
+            if artifact_id in ((current_version_of(epic, current_versions) or {}).get("artifact_refs", ()))
+        ]
+    if stories_by_artifact is not None:
+        artifact_stories = stories_by_artifact.get(artifact_id, ())
+    else:
+        artifact_stories = [
             story
             for story in stories
-            if artifact_id in ((get_current_version(story.get("versions", [])) or {}).get("artifact_refs", []))
-        ],
-        "../stories/",
-        "../releases/",
-    )
+            if artifact_id in ((current_version_of(story, current_versions) or {}).get("artifact_refs", ()))
+        ]
+    if requirements_by_artifact is not None:
+        artifact_requirements = requirements_by_artifact.get(artifact_id, ())
+    else:
+        artifact_requirements = [req for req in requirements if artifact_id in (req.get("artifact_refs") or [])]
+
+    feature_rows = build_feature_rows(artifact_features, "../features/")
+    epic_rows = build_epic_rows(artifact_epics, "../epics/", "../releases/", current_versions)
+    story_rows = build_story_rows(artifact_stories, "../stories/", "../releases/", current_versions)
     requirement_rows = build_requirement_rows(
-        [req.get("id") for req in requirements if artifact_id in (req.get("artifact_refs") or [])],
+        [req.get("id") for req in artifact_requirements],
         requirement_lookup or {},
         "../requirements/",
+        row_cache=requirement_row_cache,
     )
     tabs = [
         {
             "id": slugify("Features"),
             "label": "Features",
-            "content": render_connected_table(["Record", "Summary", "Status"], feature_rows, "Features"),
+            "content": render_connected_table(("Record", "Summary", "Status"), feature_rows, "Features"),
         },
         {
             "id": slugify("Epics"),
             "label": "Epics",
-            "content": render_connected_table(["Record", "Summary", "Release"], epic_rows, "Epics"),
+            "content": render_connected_table(("Record", "Summary", "Release"), epic_rows, "Epics"),
         },
         {
             "id": slugify("Stories"),
             "label": "Stories",
-            "content": render_connected_table(["Record", "Summary", "Release"], story_rows, "Stories"),
+            "content": render_connected_table(("Record", "Summary", "Release"), story_rows, "Stories"),
         },
         {
             "id": slugify("Requirements"),
             "label": "Requirements",
-            "content": render_connected_table(["Record", "Statement"], requirement_rows, "Requirements"),
+            "content": render_connected_table(("Record", "Statement"), requirement_rows, "Requirements"),
         },
     ]
-    html += f"""
+    parts.append(f"""
 <div class="section">
     <h2>Connected Records</h2>
     {render_tabs("artifact-connections", tabs)}
 </div>
-"""
-    return html_page(f"{entry['id']}: {entry.get('title', '')}", html, "artifacts", depth=1)
+""")
+    return html_page(f"{entry['id']}: {entry.get('title', '')}", "".join(parts), "artifacts", depth=1)
@@ -461,8 +461,8 @@ def _render_compact_card(
 '''
 
 
-def render_definitions() -> str:
-    """Render the Definitions page HTML."""
+def _build_definitions_content() -> str:
+    """Build the Definitions page body; it depends on no data, so it is built once."""
 
     # Compact definitions data with updated copy
     definitions = [
@@ -523,9 +523,7 @@ def render_definitions() -> str:
     ]
 
     # Build cards
-    cards_html = ""
-    for d in definitions:
-        cards_html += _render_compact_card(**d)
+    cards_html = "".join([_render_compact_card(**d) for d in definitions])
 
     # Boundary rules
     boundary_rows = [
@@ -537,10 +535,11 @@ def render_definitions() -> str:
         ("When something ships", "release", "Release"),
     ]
 
-    boundary_html = ""
+    boundary_parts = []
     for desc, type_key, type_name in boundary_rows:
         color = ARTIFACT_COLORS.get(type_key, "#6b7280")
-        boundary_html += f'<tr><td>{desc}</td><td><span class="type-dot" style="background:{color};"></span>{type_name}</td></tr>'
+        boundary_parts.append(f'<tr><td>{desc}</td><td><span class="type-dot" style="background:{color};"></span>{type_name}</td></tr>')
+    boundary_html = "".join(boundary_parts)
 
     content = f'''
 {DEFINITIONS_CSS}
@@ -590,9 +589,17 @@ def render_definitions() -> str:
 </div>
 '''
 
+    return content
+
+
+DEFINITIONS_CONTENT = _build_definitions_content()
+
+
+def render_definitions() -> str:
+    """Render the Definitions page HTML."""
     return html_page(
         title="Definitions",
-        content=content,
+        content=DEFINITIONS_CONTENT,
         active_section="definitions",
         depth=0,
     )
@@ -15,6 +15,17 @@ from lib.html_helpers import (
     status_badge,
 )
 
+# Connected-record tabs on every feature page: (tab id, label, table headers)
+FEATURE_TABS = tuple(
+    (slugify(label), label, headers)
+    for label, headers in (
+        ("Epics", ("Record", "Summary", "Release")),
+        ("Stories", ("Record", "Summary", "Release")),
+        ("Requirements", ("Record", "Statement")),
+        ("Business Artifacts", ("Record", "Description", "Type")),
+    )
+)
+
 
 def render_feature(
     feat: Dict,
@@ -22,10 +33,17 @@ def render_feature(
     stories: List[Dict],
     requirement_lookup: Optional[Dict[str, Dict]] = None,
     artifact_lookup: Optional[Dict[str, Dict]] = None,
+    requirement_row_cache: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    artifact_row_cache: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    epics_by_feature: Optional[Dict[str, List[Dict]]] = None,
+    stories_by_feature: Optional[Dict[str, List[Dict]]] = None,
+    current_versions: Optional[Dict[str, Optional[Dict]]] = None,
 ) -> str:
     """Render a feature as HTML."""
-    html = f"""
-<h1>{e(feat['id'])}: {e(feat.get('title', ''))}</h1>
+    feature_id = feat['id']
+    title = feat.get('title', '')
+    parts = [f"""
+<h1>{e(feature_id)}: {e(title)}</h1>
 <div class="meta">
     <strong>Status:</strong> {status_badge(feat.get('status', 'unknown'))}
 </div>
@@ -37,65 +55,57 @@ def render_feature(
     <h2>Business Value</h2>
     <p>{e(feat.get('business_value', 'No business value defined'))}</p>
 </div>
-"""
-    if feat.get('in_scope'):
-        html += '<div class="section"><h2>In Scope</h2><ul>'
-        for item in feat['in_scope']:
-            html += f'<li>{e(item)}</li>'
-        html += '</ul></div>'
+"""]
+    in_scope = feat.get('in_scope')
+    if in_scope:
+        parts.append('<div class="section"><h2>In Scope</h2><ul>')
+        parts.extend([f'<li>{e(item)}</li>' for item in in_scope])
+        parts.append('</ul></div>')
 
-    if feat.get('out_of_scope'):
-        html += '<div class="section"><h2>Out of Scope</h2><ul>'
-        for item in feat['out_of_scope']:
-            html += f'<li>{e(item)}</li>'
-        html += '</ul></div>'
+    out_of_scope = feat.get('out_of_scope')
+    if out_of_scope:
+        parts.append('<div class="section"><h2>Out of Scope</h2><ul>')
+        parts.extend([f'<li>{e(item)}</li>' for item in out_of_scope])
+        parts.append('</ul></div>')
 
-    feature_epics = [epic for epic in epics if epic.get("feature_ref") == feat.get("id")]
-    epic_rows = build_epic_rows(feature_epics, "../epics/", "../releases/")
+    if epics_by_feature is not None:
+        feature_epics = epics_by_feature.get(feature_id, ())
+    else:
+        feature_epics = [epic for epic in epics if epic.get("feature_ref") == feature_id]
+    epic_rows = build_epic_rows(feature_epics, "../epics/", "../releases/", current_versions)
 
-    epic_ids = {epic.get("id") for epic in feature_epics if epic.get("id")}
-    feature_stories = [story for story in stories if story.get("epic_ref") in epic_ids]
-    story_rows = build_story_rows(feature_stories, "../stories/", "../releases/")
+    if stories_by_feature is not None:
+        feature_stories = stories_by_feature.get(feature_id, ())
+    else:
+        epic_ids = set(filter(None, [epic.get("id") for epic in feature_epics]))
+        feature_stories = [story for story in stories if story.get("epic_ref") in epic_ids]
+    story_rows = build_story_rows(feature_stories, "../stories/", "../releases/", current_versions)
 
     requirement_rows = build_requirement_rows(
-        feat.get("requirement_refs", []),
+        feat.get("requirement_refs", ()),
         requirement_lookup or {},
         "../requirements/",
+        row_cache=requirement_row_cache,
     )
 
     artifact_rows = build_artifact_rows(
-        feat.get("artifact_refs", []),
+        feat.get("artifact_refs", ()),
         artifact_lookup or {},
         "../artifacts/",
+        row_cache=artifact_row_cache,
     )
 
     tabs = [
-        {
-            "id": slugify("Epics"),
-            "label": "Epics",
-            "content": render_connected_table(["Record", "Summary", "Release"], epic_rows, "Epics"),
-        },
-        {
-            "id": slugify("Stories"),
-            "label": "Stories",
-            "content": render_connected_table(["Record", "Summary", "Release"], story_rows, "Stories"),
-        },
-        {
-            "id": slugify("Requirements"),
-            "label": "Requirements",
-            "content": render_connected_table(["Record", "Statement"], requirement_rows, "Requirements"),
-        },
-        {
-            "id": slugify("Business Artifacts"),
-            "label": "Business Artifacts",
-            "content": render_connected_table(["Record", "Description", "Type"], artifact_rows, "Business Artifacts"),
-        },
+        {"id": tab_id, "label": label, "content": render_connected_table(headers, rows, label)}
+        for (tab_id, label, headers), rows in zip(
+            FEATURE_TABS, (epic_rows, story_rows, requirement_rows, artifact_rows)
+        )
     ]
 
-    html += f"""
+    parts.append(f"""
 <div class="section">
     <h2>Connected Records</h2>
     {render_tabs("feature-connections", tabs)}
 </div>
-"""
-    return html_page(f"{feat['id']}: {feat.get('title', '')}", html, "features", depth=1)
+""")
+    return html_page(f"{feature_id}: {title}", "".join(parts), "features", depth=1)
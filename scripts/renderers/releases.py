@@ -1,6 +1,6 @@
 """Render release pages."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from lib.html_helpers import (
     e,
@@ -13,11 +13,42 @@ from lib.html_helpers import (
 )
 
 
-def render_release(release: Dict, epics: List[Dict], stories: List[Dict]) -> str:
+def index_versions_by_release(records: List[Dict], text_field: str) -> Dict[Optional[str], List[Tuple]]:
+    """Group record versions by release_ref, sorted by record id then version.
+
+    Versions without a release_ref are grouped under None (the unreleased bucket).
+    Each entry is an (id, title, version, text) tuple, with text read from text_field.
+    """
+    by_release: Dict[Optional[str], List[Tuple]] = {}
+    add = by_release.setdefault
+    for record in records:
+        record_id = record.get("id")
+        title = record.get("title", "")
+        for version in record.get("versions", ()):
+            version_get = version.get
+            add(version_get("release_ref") or None, []).append(
+                (record_id, title, version_get("version"), version_get(text_field, ""))
+            )
+    for entries in by_release.values():
+        entries.sort(key=lambda x: (x[0] or "", x[2] or 0))
+    return by_release
+
+
+def render_release(
+    release: Dict,
+    epics: List[Dict],
+    stories: List[Dict],
+    epic_versions_by_release: Optional[Dict[Optional[str], List[Tuple]]] = None,
+    story_versions_by_release: Optional[Dict[Optional[str], List[Tuple]]] = None,
+) -> str:
     """Render a release as HTML."""
+    if epic_versions_by_release is None:
+        epic_versions_by_release = index_versions_by_release(epics, "summary")
+    if story_versions_by_release is None:
+        story_versions_by_release = index_versions_by_release(stories, "description")
     release_id = release["id"]
     is_unreleased = release_id == "UNRELEASED" or release.get("is_unreleased")
-    html = f"""
+    parts = [f"""
 <h1>{e(release['id'])}</h1>
 <div class="meta">
     <strong>Status:</strong> {status_badge(release.get('status', 'unknown'))} &nbsp;
@@ -28,53 +59,23 @@ def render_release(release: Dict, epics: List[Dict], stories: List[Dict]) -> str
     <h2>Description</h2>
     <p>{e(release.get('description', 'No description'))}</p>
 </div>
-"""
+"""]
     if release.get('notes'):
-        html += f"""
+        parts.append(f"""
 <div class="section">
     <h2>Notes</h2>
     <p>{e(release['notes'])}</p>
 </div>
-"""
+""")
     if release.get('tags'):
-        html += f'<p><strong>Tags:</strong> {", ".join(e(t) for t in release["tags"])}</p>'
-
-    epic_versions = []
-    for epic in epics:
-        for version in epic.get("versions", []):
-            release_ref = version.get("release_ref")
-            if (is_unreleased and not release_ref) or (not is_unreleased and release_ref == release_id):
-                epic_versions.append(
-                    {
-                        "id": epic.get("id"),
-                        "title": epic.get("title", ""),
-                        "version": version.get("version"),
-                        "summary": version.get("summary", ""),
-                    }
-                )
-    epic_versions = sorted(epic_versions, key=lambda x: (x.get("id") or "", x.get("version") or 0))
+        parts.append(f'<p><strong>Tags:</strong> {", ".join(map(e, release["tags"]))}</p>')
 
-    story_versions = []
-    for story in stories:
-        for version in story.get("versions", []):
-            release_ref = version.get("release_ref")
-            if (is_unreleased and not release_ref) or (not is_unreleased and release_ref == release_id):
-                story_versions.append(
-                    {
-                        "id": story.get("id"),
-                        "title": story.get("title", ""),
-                        "version": version.get("version"),
-                        "description": version.get("description", ""),
-                    }
-                )
-    story_versions = sorted(story_versions, key=lambda x: (x.get("id") or "", x.get("version") or 0))
+    release_key = None if is_unreleased else release_id
+    epic_versions = epic_versions_by_release.get(release_key, ())
+    story_versions = story_versions_by_release.get(release_key, ())
 
     epic_rows = []
-    for item in epic_versions:
-        epic_id = item.get("id", "")
-        title = item.get("title", "")
-        version_number = item.get("version", "")
-        summary = item.get("summary", "No summary")
+    for epic_id, title, version_number, summary in epic_versions:
         epic_rows.append(
             [
                 f'<td class="record-cell"><a href="../epics/{e(epic_id)}.html?version={e(version_number)}">{e(epic_id)}</a>'
@@ -85,11 +86,7 @@ def render_release(release: Dict, epics: List[Dict], stories: List[Dict]) -> str
         )
 
     story_rows = []
-    for item in story_versions:
-        story_id = item.get("id", "")
-        title = item.get("title", "")
-        version_number = item.get("version", "")
-        description = item.get("description", "No description")
+    for story_id, title, version_number, description in story_versions:
         story_rows.append(
             [
                 f'<td class="record-cell"><a href="../stories/{e(story_id)}.html?version={e(version_number)}">{e(story_id)}</a>'
@@ -103,19 +100,19 @@ def render_release(release: Dict, epics: List[Dict], stories: List[Dict]) -> str
         {
             "id": "epic-versions",
             "label": "Epic Versions",
-            "content": render_connected_table(["Epic", "Version", "Summary"], epic_rows, "Epic Versions"),
+            "content": render_connected_table(("Epic", "Version", "Summary"), epic_rows, "Epic Versions"),
         },
         {
             "id": "story-versions",
             "label": "Story Versions",
-            "content": render_connected_table(["Story", "Version", "Description"], story_rows, "Story Versions"),
+            "content": render_connected_table(("Story", "Version", "Description"), story_rows, "Story Versions"),
         },
     ]
-    html += f"""
+    parts.append(f"""
 <div class="section">
     <h2>Connected Versions</h2>
     {render_tabs("release-versions", tabs)}
 </div>
-"""
+""")
 
-    return html_page(release['id'], html, "releases", depth=1)
+    return html_page(release['id'], "".join(parts), "releases", depth=1)
@@ -7,6 +7,7 @@ from lib.html_helpers import (
     build_epic_rows,
     build_feature_rows,
     build_story_rows,
+    current_version_of,
     e,
     html_page,
     render_connected_table,
@@ -14,7 +15,6 @@ from lib.html_helpers import (
     slugify,
     status_badge,
 )
-from lib.versions import get_current_version
 
 
 def render_requirement(
@@ -23,9 +23,14 @@ def render_requirement(
     epics: List[Dict],
     stories: List[Dict],
     artifact_lookup: Optional[Dict[str, Dict]] = None,
+    artifact_row_cache: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    features_by_requirement: Optional[Dict[str, List[Dict]]] = None,
+    epics_by_requirement: Optional[Dict[str, List[Dict]]] = None,
+    stories_by_requirement: Optional[Dict[str, List[Dict]]] = None,
+    current_versions: Optional[Dict[str, Optional[Dict]]] = None,
 ) -> str:
     """Render a requirement as HTML."""
-    html = f"""
+    parts = [f"""
 <h1>{e(req['id'])}: {e(req.get('title', ''))}</h1>
 <div class="meta">
     <strong>Status:</strong> {status_badge(req.get('status', 'unknown'))} &nbsp;
@@ -40,66 +45,69 @@ def render_requirement(
     <h2>Rationale</h2>
     <p>{e(req.get('rationale', 'No rationale'))}</p>
 </div>
-"""
+"""]
     if req.get('superseded_by'):
-        html += f'<p><strong>Superseded By:</strong> <a href="{req["superseded_by"]}.html">{e(req["superseded_by"])}</a></p>'
+        parts.append(f'<p><strong>Superseded By:</strong> <a href="{req["superseded_by"]}.html">{e(req["superseded_by"])}</a></p>')
     if req.get('notes'):
-        html += f'<div class="section"><h2>Notes</h2><p>{e(req["notes"])}</p></div>'
+        parts.append(f'<div class="section"><h2>Notes</h2><p>{e(req["notes"])}</p></div>')
 
     requirement_id = req.get("id")
-    feature_rows = build_feature_rows(
-        [feat for feat in features if requirement_id in (feat.get("requirement_refs") or [])],
-        "../features/",
-    )
-    epic_rows = build_epic_rows(
-        [
+    if features_by_requirement is not None:
+        requirement_features = features_by_requirement.get(requirement_id, ())
+    else:
+        requirement_features = [feat for feat in features if requirement_id in (feat.get("requirement_refs") or [])]
+    if epics_by_requirement is not None:
+        requirement_epics = epics_by_requirement.get(requirement_id, ())
+    else:
+        requirement_epics = [
             epic
             for epic in epics
-            if requirement_id in ((get_current_version(epic.get("versions", [])) or {}).get("requirement_refs", []))
-        ],
-        "../epics/",
-        "../releases/",
-    )
-    story_rows = build_story_rows(
-        [
+            if requirement_id in ((current_version_of(epic, current_versions) or {}).get("requirement_refs", ()))
+        ]
+    if stories_by_requirement is not None:
+        requirement_stories = stories_by_requirement.get(requirement_id, ())
+    else:
+        requirement_stories = [
             story
             for story in stories
-            if requirement_id in ((get_current_version(story.get("versions", [])) or {}).get("requirement_refs", []))
-        ],
-        "../stories/",
-        "../releases/",
-    )
+            if requirement_id in ((current_version_of(story, current_versions) or {}).get("requirement_refs", ()))
+        ]
+
+    feature_rows = build_feature_rows(requirement_features, "../features/")
+    epic_rows = build_epic_rows(requirement_epics, "../epics/", "../releases/", current_versions)
+    story_rows = build_story_rows(requirement_stories, "../stories/", "../releases/", current_versions)
     artifact_rows = build_artifact_rows(
-        req.get("artifact_refs", []),
+        req.get("artifact_refs", ()),
         artifact_lookup or {},
         "../artifacts/",
+        row_cache=artifact_row_cache,
     )
     tabs = [
         {
             "id": slugify("Features"),
             "label": "Features",
-            "content": render_connected_table(["Record", "Summary", "Status"], feature_rows, "Features"),
+            "content": render_connected_table(("Record", "Summary", "Status"), feature_rows, "Features"),
         },
         {
             "id": slugify("Epics"),
             "label": "Epics",
-            "content": render_connected_table(["Record", "Summary", "Release"], epic_rows, "Epics"),
+            "content": render_connected_table(("Record", "Summary", "Release"), epic_rows, "Epics"),
         },
         {
             "id": slugify("Stories"),
             "label": "Stories",
-            "content": render_connected_table(["Record", "Summary", "Release"], story_rows, "Stories"),
+            "content": render_connected_table(("Record", "Summary", "Release"), story_rows, "Stories"),
         },
         {
             "id": slugify("Business Artifacts"),
             "label": "Business Artifacts",
-            "content": render_connected_table(["Record", "Description", "Type"], artifact_rows, "Business Artifacts"),
+            "content": render_connected_table(("Record", "Description", "Type"), artifact_rows, "Business Artifacts"),
         },
     ]
-    html += f"""
+    parts.append(f"""
 <div class="section">
     <h2>Connected Records</h2>
     {render_tabs("requirement-connections", tabs)}
 </div>
-"""
-    return html_page(f"{req['id']}: {req.get('title', '')}", html, "requirements", depth=1)
+""")
+    return html_page(f"{req['id']}: {req.get('title', '')}", "".join(parts), "requirements", depth=1)
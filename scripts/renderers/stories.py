@@ -5,14 +5,16 @@ from typing import Dict, List, Optional
 from lib.html_helpers import (
     build_artifact_rows,
     build_requirement_rows,
+    current_version_of,
     e,
     html_page,
     render_connected_table,
+    render_release_link,
     render_tabs,
     slugify,
     status_badge,
+    version_select_script,
 )
-from lib.versions import get_current_version
 
 
 def render_story(
@@ -21,136 +23,124 @@ def render_story(
     features: List[Dict],
     requirement_lookup: Optional[Dict[str, Dict]] = None,
     artifact_lookup: Optional[Dict[str, Dict]] = None,
+    requirement_row_cache: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    artifact_row_cache: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    release_links: Optional[Dict[Optional[str], str]] = None,
+    epic_lookup: Optional[Dict[str, Dict]] = None,
+    current_versions: Optional[Dict[str, Optional[Dict]]] = None,
 ) -> str:
     """Render a story as HTML."""
     versions = story.get('versions', [])
     doc_status = story.get("status") or "unknown"
-    html = f"""
+    parts = [f"""
 <h1>{e(story['id'])}: {e(story.get('title', ''))}</h1>
-"""
+"""]
 
+    if release_links is None:
+        release_links = {}
+    current = None
     if versions:
-        current = get_current_version(versions)
+        current = current_version_of(story, current_versions)
         current_version = current.get("version") if current else None
         versions_sorted = sorted(versions, key=lambda x: x.get("version", 0), reverse=True)
-        select_options = "\n".join(
-            f'<option value="{e(v.get("version"))}"{" selected" if v.get("version") == current_version else ""}>'
-            f'v{e(v.get("version"))} — {e(v.get("release_ref") or "Unassigned")}</option>'
-            for v in versions_sorted
-        )
-        html += f"""
-<div class="meta">
-    <span><strong>Documentation Status:</strong> {status_badge(doc_status)}</span>
-    <span><strong>Version:</strong>
-        <select id="version-select" class="version-select">
-            {select_options}
-        </select>
-    </span>
-</div>
-<div class="version-panels">
-"""
+        option_parts = []
+        panel_parts = []
         for v in versions_sorted:
+            version_number = v.get("version")
             release_ref = v.get("release_ref")
-            release_html = (
-                f'<a href="../releases/{e(release_ref)}.html">{e(release_ref)}</a>'
-                if release_ref
-                else "Unassigned"
+            option_parts.append(
+                f'<option value="{e(version_number)}"{" selected" if version_number == current_version else ""}>'
+                f'v{e(version_number)} — {e(release_ref or "Unassigned")}</option>'
             )
-            html += f"""
-    <div class="version-panel" data-version="{e(v.get('version'))}">
+            release_html = release_links.get(release_ref)
+            if release_html is None:
+                release_html = render_release_link(release_ref, "../releases/")
+            panel_parts.append(f"""
+    <div class="version-panel" data-version="{e(version_number)}">
         <div class="version-meta">
-            <strong>Version:</strong> v{e(v.get('version'))} &nbsp;
+            <strong>Version:</strong> v{e(version_number)} &nbsp;
             <strong>Release:</strong> {release_html}
         </div>
         <div class="section">
             <h2>Description</h2>
             <p>{e(v.get('description', 'No description'))}</p>
         </div>
-"""
+""")
             ac = v.get('acceptance_criteria', [])
             if ac:
-                html += '<div class="section"><h2>Acceptance Criteria</h2><ul>'
+                panel_parts.append('<div class="section"><h2>Acceptance Criteria</h2><ul>')
                 for criterion in ac:
                     if isinstance(criterion, dict):
-                        html += f'<li><strong>{e(criterion.get("id", "AC"))}:</strong> {e(criterion.get("statement", ""))}'
+                        panel_parts.append(f'<li><strong>{e(criterion.get("id", "AC"))}:</strong> {e(criterion.get("statement", ""))}')
                         if criterion.get('notes'):
-                            html += f' <em>({e(criterion["notes"])})</em>'
+                            panel_parts.append(f' <em>({e(criterion["notes"])})</em>')
                     else:
-                        html += f'<li><strong>AC:</strong> {e(str(criterion))}'
-                    html += '</li>'
-                html += '</ul></div>'
+                        panel_parts.append(f'<li><strong>AC:</strong> {e(str(criterion))}')
+                    panel_parts.append('</li>')
+                panel_parts.append('</ul></div>')
 
             ti = v.get('test_intent', {})
             if ti.get('failure_modes') or ti.get('guarantees') or ti.get('exclusions'):
-                html += '<div class="section"><h2>Test Intent</h2>'
+                panel_parts.append('<div class="section"><h2>Test Intent</h2>')
                 if ti.get('failure_modes'):
-                    html += '<h3>Failure Modes (must not happen)</h3><ul>'
+                    panel_parts.append('<h3>Failure Modes (must not happen)</h3><ul>')
                     for item in ti['failure_modes']:
-                        html += f'<li>{e(item)}</li>'
-                    html += '</ul>'
+                        panel_parts.append(f'<li>{e(item)}</li>')
+                    panel_parts.append('</ul>')
                 if ti.get('guarantees'):
-                    html += '<h3>Guarantees (must always be true)</h3><ul>'
+                    panel_parts.append('<h3>Guarantees (must always be true)</h3><ul>')
                     for item in ti['guarantees']:
-                        html += f'<li>{e(item)}</li>'
-                    html += '</ul>'
+                        panel_parts.append(f'<li>{e(item)}</li>')
+                    panel_parts.append('</ul>')
                 if ti.get('exclusions'):
-                    html += '<h3>Exclusions (not tested)</h3><ul>'
+                    panel_parts.append('<h3>Exclusions (not tested)</h3><ul>')
                     for item in ti['exclusions']:
-                        html += f'<li>{e(item)}</li>'
-                    html += '</ul>'
-                html += '</div>'
+                        panel_parts.append(f'<li>{e(item)}</li>')
+                    panel_parts.append('</ul>')
+                panel_parts.append('</div>')
 
-            html += "</div>"
+            panel_parts.append("</div>")
 
-        html += """
+        select_options = "\n".join(option_parts)
+        parts.append(f"""
+<div class="meta">
+    <span><strong>Documentation Status:</strong> {status_badge(doc_status)}</span>
+    <span><strong>Version:</strong>
+        <select id="version-select" class="version-select">
+            {select_options}
+        </select>
+    </span>
 </div>
-<script>
-(() => {
-    const select = document.getElementById('version-select');
-    const panels = Array.from(document.querySelectorAll('.version-panel'));
-    if (!select || panels.length === 0) return;
-    const params = new URLSearchParams(window.location.search);
-    const requestedVersion = params.get('version');
-    if (requestedVersion) {
-        const option = Array.from(select.options).find(opt => opt.value === requestedVersion);
-        if (option) {
-            select.value = requestedVersion;
-        }
-    }
-    function show(version) {
-        panels.forEach(panel => {
-            panel.classList.toggle('active', panel.dataset.version === version);
-        });
-    }
-    select.addEventListener('change', () => show(select.value));
-    show(select.value);
-})();
-</script>
-"""
+<div class="version-panels">
+""")
+        parts.extend(panel_parts)
+        parts.append("\n</div>\n")
+        parts.append(version_select_script(1))
     else:
-        html += '<p><em>No versions recorded.</em></p>'
+        parts.append('<p><em>No versions recorded.</em></p>')
 
-    current_version = get_current_version(versions) if versions else None
     requirement_rows = build_requirement_rows(
-        (current_version or {}).get("requirement_refs", []),
+        (current or {}).get("requirement_refs", ()),
         requirement_lookup or {},
         "../requirements/",
+        row_cache=requirement_row_cache,
     )
     artifact_rows = build_artifact_rows(
-        (current_version or {}).get("artifact_refs", []),
+        (current or {}).get("artifact_refs", ()),
         artifact_lookup or {},
         "../artifacts/",
+        row_cache=artifact_row_cache,
     )
     tabs = [
         {
             "id": slugify("Requirements"),
             "label": "Requirements",
-            "content": render_connected_table(["Record", "Statement"], requirement_rows, "Requirements"),
+            "content": render_connected_table(("Record", "Statement"), requirement_rows, "Requirements"),
         },
         {
             "id": slugify("Business Artifacts"),
             "label": "Business Artifacts",
-            "content": render_connected_table(["Record", "Description", "Type"], artifact_rows, "Business Artifacts"),
+            "content": render_connected_table(("Record", "Description", "Type"), artifact_rows, "Business Artifacts"),
         },
     ]
     connected_items = []
@@ -160,18 +150,21 @@ def render_story(
             f'<div class="connected-summary"><strong>Epic:</strong> '
             f'<a href="../epics/{e(epic_ref)}.html">{e(epic_ref)}</a></div>'
         )
-        epic = next((item for item in epics if item.get("id") == epic_ref), None)
+        if epic_lookup is not None:
+            epic = epic_lookup.get(epic_ref)
+        else:
+            epic = next((item for item in epics if item.get("id") == epic_ref), None)
         feature_ref = epic.get("feature_ref") if epic else None
         if feature_ref:
             connected_items.append(
                 f'<div class="connected-summary"><strong>Feature:</strong> '
                 f'<a href="../features/{e(feature_ref)}.html">{e(feature_ref)}</a></div>'
             )
-    html += f"""
+    parts.append(f"""
 <div class="section">
     <h2>Connected Records</h2>
     {''.join(connected_items)}
     {render_tabs("story-connections", tabs)}
 </div>
-"""
-    return html_page(f"{story['id']}: {story.get('title', '')}", html, "stories", depth=1)
+""")
+    return html_page(f"{story['id']}: {story.get('title', '')}", "".join(parts), "stories", depth=1)